@@ -0,0 +1,116 @@
+import time
+import datetime
+
+# Message kinds
+CHAT = 'chat'
+JOIN = 'join'
+LEAVE = 'leave'
+WELCOME = 'welcome'
+SYSTEM = 'system'
+
+# Output formats
+STAMPED = 'stamped'      # "[ts] alice: hi" - chat_server.py wire and log format
+RELAY = 'relay'          # "alice: hi" / "SERVER: ..." - server.py wire format
+RELAY_LOG = 'relay_log'  # "[ts] alice: hi" - server.py log format
+
+_STAMPED_TEMPLATES = {
+    CHAT: "{sender}: {text}",
+    JOIN: "{sender} joined the chat!",
+    LEAVE: "{sender} left the chat.",
+    WELCOME: "Welcome to the chat, {sender}!",
+    SYSTEM: "{text}",
+}
+
+_RELAY_TEMPLATES = {
+    CHAT: "{sender}: {text}",
+    JOIN: "SERVER: {sender} has joined the chat.",
+    LEAVE: "SERVER: {sender} has left the chat.",
+    WELCOME: "SERVER: Welcome to the chat, {sender}!",
+    SYSTEM: "{text}",
+}
+
+# format name -> (templates, prefix with timestamp)
+_FORMATS = {
+    STAMPED: (_STAMPED_TEMPLATES, True),
+    RELAY: (_RELAY_TEMPLATES, False),
+    RELAY_LOG: (_RELAY_TEMPLATES, True),
+}
+
+# (wall clock second, formatted string) of the last rendered timestamp
+_last_timestamp = (None, None)
+
+
+def format_timestamp(timestamp_ns=None):
+    """Get formatted timestamp for a monotonic ns time, cached per second"""
+    global _last_timestamp
+    wall_ns = time.time_ns()
+    if timestamp_ns is not None:
+        # Map onto the wall clock using the current offset, so suspend and
+        # clock steps since startup do not skew the result
+        wall_ns -= time.monotonic_ns() - timestamp_ns
+    second = wall_ns // 1_000_000_000
+
+    cached_second, cached_text = _last_timestamp
+    if cached_second == second:
+        return cached_text
+
+    text = datetime.datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+    # Tuple assignment is atomic, so concurrent threads never see a torn entry
+    _last_timestamp = (second, text)
+    return text
+
+
+class ChatMessage:
+    """A single chat event, rendered lazily into each output format"""
+
+    __slots__ = ('timestamp_ns', 'sender', 'kind', 'payload', '_rendered', '_encoded')
+
+    def __init__(self, kind, sender=None, payload=b'', timestamp_ns=None):
+        self.timestamp_ns = time.monotonic_ns() if timestamp_ns is None else timestamp_ns
+        self.sender = sender
+        self.kind = kind
+        self.payload = payload
+        self._rendered = {}
+        self._encoded = {}
+
+    @classmethod
+    def system(cls, text):
+        """Create a server event message from plain text"""
+        return cls(SYSTEM, payload=text.encode('utf-8'))
+
+    @property
+    def timestamp(self):
+        """Formatted wall-clock timestamp of the message"""
+        return format_timestamp(self.timestamp_ns)
+
+    def render(self, fmt=STAMPED):
+        """Render the message as text, caching the result per format"""
+        if fmt in self._rendered:
+            return self._rendered[fmt]
+
+        templates, stamped = _FORMATS[fmt]
+        text = templates[self.kind].format(
+            sender=self.sender,
+            text=self.payload.decode('utf-8', errors='replace'),
+        )
+        if stamped:
+            text = f"[{self.timestamp}] {text}"
+
+        self._rendered[fmt] = text
+        return text
+
+    def encode(self, fmt=STAMPED):
+        """Render the message as UTF-8 bytes for the wire, cached per format"""
+        if fmt in self._encoded:
+            return self._encoded[fmt]
+
+        data = self.render(fmt).encode('utf-8')
+        self._encoded[fmt] = data
+        return data
+
+    def __str__(self):
+        return self.render()
+
+    def __repr__(self):
+        return (f"ChatMessage(kind={self.kind!r}, sender={self.sender!r}, "
+                f"payload={self.payload!r}, timestamp_ns={self.timestamp_ns})")
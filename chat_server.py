@@ -1,8 +1,9 @@
 import socket
 import threading
-import datetime
 import sys
 
+from chat_message import ChatMessage, CHAT, JOIN, LEAVE, WELCOME, format_timestamp
+
 class ChatServer:
     def __init__(self, host='0.0.0.0', port=5555):
         self.host = host
@@ -20,7 +21,7 @@ class ChatServer:
             self.server_socket.bind((self.host, self.port))
             self.server_socket.listen(5)
             
-            log_msg = f"[{self.get_timestamp()}] Server started on {self.host}:{self.port}"
+            log_msg = ChatMessage.system(f"Server started on {self.host}:{self.port}")
             print(log_msg)
             self.log_message(log_msg)
             
@@ -59,27 +60,27 @@ class ChatServer:
                 self.usernames[client_socket] = username
             
             # Notify all clients about the new user
-            join_msg = f"[{self.get_timestamp()}] {username} joined the chat!"
+            join_msg = ChatMessage(JOIN, username)
             print(join_msg)
             self.log_message(join_msg)
             self.broadcast(join_msg, client_socket)
             
             # Send welcome message to the new client
-            welcome_msg = f"[{self.get_timestamp()}] Welcome to the chat, {username}!"
-            client_socket.send(welcome_msg.encode('utf-8'))
+            welcome_msg = ChatMessage(WELCOME, username)
+            client_socket.send(welcome_msg.encode())
             
             # Listen for messages from this client
             while True:
-                message = client_socket.recv(1024).decode('utf-8')
+                payload = client_socket.recv(1024)
                 
-                if not message:
+                if not payload:
                     break
                 
-                # Format and broadcast the message
-                formatted_msg = f"[{self.get_timestamp()}] {username}: {message}"
-                print(formatted_msg)
-                self.log_message(formatted_msg)
-                self.broadcast(formatted_msg, client_socket)
+                # Record the message; it is formatted once on first use
+                chat_msg = ChatMessage(CHAT, username, payload)
+                print(chat_msg)
+                self.log_message(chat_msg)
+                self.broadcast(chat_msg, client_socket)
                 
         except ConnectionResetError:
             pass
@@ -95,7 +96,7 @@ class ChatServer:
                         del self.usernames[client_socket]
                 
                 if username:
-                    leave_msg = f"[{self.get_timestamp()}] {username} left the chat."
+                    leave_msg = ChatMessage(LEAVE, username)
                     print(leave_msg)
                     self.log_message(leave_msg)
                     self.broadcast(leave_msg, None)
@@ -104,11 +105,12 @@ class ChatServer:
     
     def broadcast(self, message, sender_socket):
         """Broadcast message to all clients except sender"""
+        data = message.encode()
         with self.lock:
             for client in self.clients:
                 if client != sender_socket:
                     try:
-                        client.send(message.encode('utf-8'))
+                        client.send(data)
                     except:
                         # If sending fails, remove the client
                         if client in self.clients:
@@ -120,17 +122,17 @@ class ChatServer:
         """Save message to log file"""
         try:
             with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(message + '\n')
+                f.write(message.render() + '\n')
         except Exception as e:
             print(f"[LOG ERROR] {e}")
     
     def get_timestamp(self):
         """Get formatted timestamp"""
-        return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return format_timestamp()
     
     def shutdown(self):
         """Shutdown the server gracefully"""
-        log_msg = f"[{self.get_timestamp()}] Server shutting down..."
+        log_msg = ChatMessage.system("Server shutting down...")
         print(log_msg)
         self.log_message(log_msg)
         
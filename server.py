@@ -1,6 +1,7 @@
 import socket
 import threading
-import datetime
+
+from chat_message import ChatMessage, CHAT, JOIN, LEAVE, RELAY, RELAY_LOG
 
 # Configuration
 HOST = '0.0.0.0'  # Listen on all network interfaces
@@ -11,18 +12,18 @@ clients = {}  # socket: username
 lock = threading.Lock()
 
 def log_message(message):
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_entry = f"[{timestamp}] {message}\n"
+    log_entry = message.render(RELAY_LOG)
     with open(LOG_FILE, 'a') as f:
-        f.write(log_entry)
-    print(log_entry.strip())
+        f.write(log_entry + '\n')
+    print(log_entry)
 
 def broadcast(message, sender_socket=None):
+    data = message.encode(RELAY)
     with lock:
         for client_socket in clients:
             if client_socket != sender_socket:
                 try:
-                    client_socket.send(message.encode('utf-8'))
+                    client_socket.send(data)
                 except:
                     client_socket.close()
                     # We'll handle removal in the handle_client thread
@@ -39,19 +40,19 @@ def handle_client(client_socket, address):
         with lock:
             clients[client_socket] = username
         
-        join_msg = f"SERVER: {username} has joined the chat."
+        join_msg = ChatMessage(JOIN, username)
         log_message(join_msg)
         broadcast(join_msg)
 
         while True:
-            message = client_socket.recv(1024).decode('utf-8')
-            if not message:
+            payload = client_socket.recv(1024)
+            if not payload:
                 break
             
-            if message == "/exit":
+            if payload == b"/exit":
                 break
             
-            chat_msg = f"{username}: {message}"
+            chat_msg = ChatMessage(CHAT, username, payload)
             log_message(chat_msg)
             broadcast(chat_msg, client_socket)
 
@@ -61,7 +62,7 @@ def handle_client(client_socket, address):
         if client_socket in clients:
             with lock:
                 username = clients.pop(client_socket)
-            leave_msg = f"SERVER: {username} has left the chat."
+            leave_msg = ChatMessage(LEAVE, username)
             log_message(leave_msg)
             broadcast(leave_msg)
         
@@ -72,7 +73,7 @@ def start_server():
     server.bind((HOST, PORT))
     server.listen()
     
-    log_message(f"SERVER STARTED: Listening on {HOST}:{PORT}")
+    log_message(ChatMessage.system(f"SERVER STARTED: Listening on {HOST}:{PORT}"))
     
     while True:
         client_socket, address = server.accept()
@@ -0,0 +1,65 @@
+import time
+import datetime
+
+import chat_message
+from chat_message import ChatMessage, CHAT, JOIN, LEAVE, WELCOME, STAMPED, RELAY, RELAY_LOG
+
+def check_stamped_format():
+    username, message = "Alice", "Hello world!"
+    cases = [
+        (ChatMessage(CHAT, username, message.encode('utf-8')), "{ts}] {username}: {message}"),
+        (ChatMessage(JOIN, username), "{ts}] {username} joined the chat!"),
+        (ChatMessage(LEAVE, username), "{ts}] {username} left the chat."),
+        (ChatMessage(WELCOME, username), "{ts}] Welcome to the chat, {username}!"),
+        (ChatMessage.system("Server started on 0.0.0.0:5555"), "{ts}] Server started on 0.0.0.0:5555"),
+    ]
+    for msg, template in cases:
+        expected = "[" + template.format(ts=msg.timestamp, username=username, message=message)
+        assert msg.render(STAMPED) == expected, msg.render(STAMPED)
+        assert msg.encode(STAMPED) == expected.encode('utf-8')
+
+def check_relay_format():
+    username, message = "Bob", "Hi Alice!"
+    cases = [
+        (ChatMessage(CHAT, username, message.encode('utf-8')), f"{username}: {message}"),
+        (ChatMessage(JOIN, username), f"SERVER: {username} has joined the chat."),
+        (ChatMessage(LEAVE, username), f"SERVER: {username} has left the chat."),
+        (ChatMessage.system("SERVER STARTED: Listening on 0.0.0.0:55555"), "SERVER STARTED: Listening on 0.0.0.0:55555"),
+    ]
+    for msg, expected in cases:
+        assert msg.render(RELAY) == expected, msg.render(RELAY)
+        assert msg.encode(RELAY) == expected.encode('utf-8')
+        assert msg.render(RELAY_LOG) == f"[{msg.timestamp}] {expected}"
+
+def check_render_cache():
+    msg = ChatMessage(CHAT, "Alice", b"cached")
+    assert msg.render(STAMPED) is msg.render(STAMPED)
+    assert msg.encode(RELAY) is msg.encode(RELAY)
+
+def check_timestamp():
+    before = datetime.datetime.now().replace(microsecond=0)
+    stamp = chat_message.format_timestamp(time.monotonic_ns())
+    after = datetime.datetime.now()
+    parsed = datetime.datetime.strptime(stamp, "%Y-%m-%d %H:%M:%S")
+    assert before <= parsed <= after, stamp
+
+    # The formatted string is cached for its wall clock second
+    assert chat_message._last_timestamp[1] is stamp
+
+    # Older messages are mapped back onto the current wall clock
+    hour_ago = chat_message.format_timestamp(time.monotonic_ns() - 3600 * 1_000_000_000)
+    parsed = datetime.datetime.strptime(hour_ago, "%Y-%m-%d %H:%M:%S")
+    assert abs((before - datetime.timedelta(hours=1) - parsed).total_seconds()) <= 1, hour_ago
+
+def check_invalid_utf8():
+    # Invalid or split multi-byte sequences are replaced instead of raising
+    assert ChatMessage(CHAT, "Alice", b"bad \xff").render(RELAY) == "Alice: bad �"
+    assert ChatMessage(CHAT, "Alice", "hé".encode('utf-8')[:-1]).render(RELAY) == "Alice: h�"
+
+if __name__ == "__main__":
+    check_stamped_format()
+    check_relay_format()
+    check_render_cache()
+    check_timestamp()
+    check_invalid_utf8()
+    print("Message format checks passed.")